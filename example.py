@@ -4,6 +4,12 @@
 
 import asyncio
 
+try:
+    # 可选：uvloop提供更快的事件循环
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from milvus_orm import Model, connect, disconnect
 from milvus_orm.exceptions import DoesNotExist
 from milvus_orm.fields import (
@@ -162,4 +168,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
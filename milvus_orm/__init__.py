@@ -5,24 +5,33 @@ milvus_orm - A Django-style ORM for Milvus vector database with async support.
 __version__ = "0.1.0"
 
 
+# 导入缓存
+from .cache import QueryEmbeddingCache
+
 # 导入客户端函数
-from .client import connect, disconnect, get_client
+from .client import connect, disconnect, get_client, get_client_sync
 
 # 导入字段类型
 from .fields import (
+    BFloat16VectorField,
     BigIntField,
     BooleanField,
     CharField,
     Field,
+    Float16VectorField,
     FloatField,
     FloatVectorField,
+    Int8VectorField,
     IntegerField,
     JsonField,
     SparseFloatVectorField,
 )
 
 # 导入模型类
-from .models import Model
+from .models import Model, create_all
+
+# 导入查询函数
+from .query import SearchQuery, gather_all
 
 __all__ = [
     "Field",
@@ -31,11 +40,19 @@ __all__ = [
     "CharField",
     "FloatField",
     "FloatVectorField",
+    "Float16VectorField",
+    "BFloat16VectorField",
+    "Int8VectorField",
     "IntegerField",
     "JsonField",
     "SparseFloatVectorField",
     "Model",
+    "QueryEmbeddingCache",
+    "SearchQuery",
     "connect",
+    "create_all",
     "disconnect",
+    "gather_all",
     "get_client",
+    "get_client_sync",
 ]
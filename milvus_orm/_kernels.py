@@ -0,0 +1,30 @@
+"""
+Vectorized distance kernels used for client-side reranking of search results.
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+
+def l2_batch(db: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Squared L2 distance from q to each row of db, matching Milvus' L2 metric."""
+    diff = db - q
+    return np.einsum("ij,ij->i", diff, diff)
+
+
+def ip_batch(db: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Inner product of q with each row of db."""
+    return db @ q
+
+
+def cosine_batch(db: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Cosine similarity of q with each row of db."""
+    return (db @ q) / (np.linalg.norm(db, axis=1) * np.linalg.norm(q))
+
+
+METRIC_KERNELS: Dict[str, Callable[[np.ndarray, np.ndarray], np.ndarray]] = {
+    "L2": l2_batch,
+    "IP": ip_batch,
+    "COSINE": cosine_batch,
+}
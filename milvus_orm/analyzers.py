@@ -1,27 +1,42 @@
-STANDARD_ANALYZER = {
-    "type": "standard",
-}
+"""
+Predefined analyzer configs for CharField(analyzer_params=...).
 
+The configs are frozen so they can be shared safely; copy them with
+milvus_orm.utils.thaw() before customizing.
+"""
 
-CHINESE_ANALYZER = {
-    "type": "chinese",
-}
+from .utils import freeze
 
+STANDARD_ANALYZER = freeze(
+    {
+        "type": "standard",
+    }
+)
 
-AUTO_ANALYZER = {
-    "tokenizer": {
-        "type": "language_identifier",  # Must be `language_identifier`
-        "identifier": "whatlang",  # or `lingua`
-        "analyzers": {  # A set of analyzer configs
-            "default": {
-                "tokenizer": "standard"  # fallback if language detection fails
-            },
-            "English": {  # Analyzer name that matches whatlang output
-                "type": "english"
-            },
-            "Mandarin": {  # Analyzer name that matches whatlang output
-                "tokenizer": "jieba"
+
+CHINESE_ANALYZER = freeze(
+    {
+        "type": "chinese",
+    }
+)
+
+
+AUTO_ANALYZER = freeze(
+    {
+        "tokenizer": {
+            "type": "language_identifier",  # Must be `language_identifier`
+            "identifier": "whatlang",  # or `lingua`
+            "analyzers": {  # A set of analyzer configs
+                "default": {
+                    "tokenizer": "standard"  # fallback if language detection fails
+                },
+                "English": {  # Analyzer name that matches whatlang output
+                    "type": "english"
+                },
+                "Mandarin": {  # Analyzer name that matches whatlang output
+                    "tokenizer": "jieba"
+                },
             },
-        },
+        }
     }
-}
+)
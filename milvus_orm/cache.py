@@ -0,0 +1,70 @@
+"""
+Cache module for milvus_orm. Caches query embeddings so repeated text
+searches skip the call to the embedding model.
+"""
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+import numpy as np
+
+
+class QueryEmbeddingCache:
+    """
+    LRU cache of query embeddings.
+
+    Entries are keyed by the embedder and the SHA-256 of the query text, so
+    embedders of different models or dimensions never share vectors. The
+    cache holds a reference to every embedder it has seen; embeddings of
+    unhashable embedders are not cached.
+    """
+
+    def __init__(self, maxsize: int = 10_000):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[Hashable, bytes], np.ndarray]" = OrderedDict()
+
+    @staticmethod
+    def _key(text: str, embedder: Any) -> Optional[Tuple[Hashable, bytes]]:
+        try:
+            hash(embedder)
+        except TypeError:
+            # An id() could be reused by another embedder once this one is
+            # collected, so unhashable embedders are not cached
+            return None
+        return embedder, hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get(self, text: str, embedder: Any = None) -> Optional[np.ndarray]:
+        """Return the cached embedding for text, or None on a miss."""
+        key = self._key(text, embedder)
+        if key is None:
+            return None
+        vector = self._data.get(key)
+        if vector is not None:
+            self._data.move_to_end(key)
+        return vector
+
+    def put(self, text: str, vector: Any, embedder: Any = None) -> np.ndarray:
+        """
+        Store the embedding for text, evicting the least recently used entry.
+
+        The cache keeps its own copy and returns it read-only, so callers
+        cannot change cached vectors in place.
+        """
+        vector = np.array(vector, dtype=np.float32)
+        vector.setflags(write=False)
+        key = self._key(text, embedder)
+        if key is None:
+            return vector
+        self._data[key] = vector
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return vector
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -2,17 +2,43 @@
 Client module for milvus_orm. Manages connection to Milvus using AsyncMilvusClient.
 """
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
 
 from pymilvus import AsyncMilvusClient
 
-# Global client instance
-_client: Optional[AsyncMilvusClient] = None
-_client_config: Optional[Dict[str, Any]] = None
+DEFAULT_ALIAS = "default"
+
+
+@dataclass(frozen=True, slots=True)
+class ClientConfig:
+    """Immutable, hashable connection settings of a client."""
+
+    uri: str
+    token: Optional[str] = None
+    timeout: Optional[float] = 10
+    extra: Tuple[Tuple[str, Any], ...] = ()
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        """Return the keyword arguments for AsyncMilvusClient."""
+        return {
+            "uri": self.uri,
+            "token": self.token,
+            "timeout": self.timeout,
+            **dict(self.extra),
+        }
+
+
+# Connected clients and their configs, keyed by connection alias
+_clients: Dict[str, AsyncMilvusClient] = {}
+_client_configs: Dict[str, ClientConfig] = {}
 
 
 async def connect(
-    uri: str = "http://localhost:19530", token: Optional[str] = None, **kwargs
+    uri: str = "http://localhost:19530",
+    token: Optional[str] = None,
+    alias: str = DEFAULT_ALIAS,
+    **kwargs,
 ) -> AsyncMilvusClient:
     """
     Connect to Milvus server.
@@ -20,63 +46,107 @@ async def connect(
     Args:
         uri: Milvus server URI
         token: Authentication token
+        alias: Name under which the connection is registered
         **kwargs: Additional connection parameters
 
     Returns:
         AsyncMilvusClient instance
     """
-    global _client, _client_config
-
     # If client is already connected, return it
-    if _client is not None:
-        return _client
+    client = _clients.get(alias)
+    if client is not None:
+        return client
 
     # Create new client
-    _client_config = {"uri": uri, "token": token, "timeout": 10, **kwargs}
-
-    _client = AsyncMilvusClient(**_client_config)
-    return _client
+    timeout = kwargs.pop("timeout", 10)
+    config = ClientConfig(
+        uri=uri, token=token, timeout=timeout, extra=tuple(sorted(kwargs.items()))
+    )
+
+    client = AsyncMilvusClient(**config.to_kwargs())
+    _clients[alias] = client
+    _client_configs[alias] = config
+    return client
 
 
-async def disconnect() -> None:
+async def disconnect(alias: str = DEFAULT_ALIAS) -> None:
     """
     Disconnect from Milvus server.
+
+    Args:
+        alias: Name of the connection to close
     """
-    global _client, _client_config
+    client = _clients.pop(alias, None)
+    _client_configs.pop(alias, None)
 
-    if _client is not None:
-        await _client.close()
-        _client = None
-        _client_config = None
+    if client is not None:
+        await client.close()
 
 
-async def get_client() -> Optional[AsyncMilvusClient]:
+async def get_client(alias: str = DEFAULT_ALIAS) -> Optional[AsyncMilvusClient]:
     """
-    Get the current Milvus client instance.
+    Get the Milvus client instance registered under an alias.
+
+    Args:
+        alias: Name of the connection
 
     Returns:
         AsyncMilvusClient instance if connected, None otherwise
     """
-    global _client
-
-    # If client is not connected, connect with default settings
-    if _client is None:
+    # If the default client is not connected, connect with default settings
+    if alias == DEFAULT_ALIAS and alias not in _clients:
         await connect()
 
-    return _client
+    return _clients.get(alias)
 
 
-async def ensure_connection() -> AsyncMilvusClient:
+def get_client_config(alias: str = DEFAULT_ALIAS) -> Optional[ClientConfig]:
+    """
+    Get the settings a connection was created with.
+
+    Args:
+        alias: Name of the connection
+
+    Returns:
+        ClientConfig if connected, None otherwise
+    """
+    return _client_configs.get(alias)
+
+
+def get_client_sync(alias: str = DEFAULT_ALIAS) -> Optional[AsyncMilvusClient]:
+    """
+    Get the Milvus client instance registered under an alias without awaiting.
+
+    This is the fast path for the already-connected case; fall back to
+    ensure_connection() when it returns None.
+
+    Args:
+        alias: Name of the connection
+
+    Returns:
+        AsyncMilvusClient instance if connected, None otherwise
+    """
+    return _clients.get(alias)
+
+
+async def ensure_connection(alias: str = DEFAULT_ALIAS) -> AsyncMilvusClient:
     """
     Ensure that we have an active connection to Milvus.
 
+    Args:
+        alias: Name of the connection
+
     Returns:
         AsyncMilvusClient instance
 
     Raises:
         ConnectionError: If connection cannot be established
     """
-    client = await get_client()
+    client = _clients.get(alias)
+    if client is not None:
+        return client
+
+    client = await get_client(alias)
     if client is None:
-        raise ConnectionError("Failed to connect to Milvus")
+        raise ConnectionError(f"Failed to connect to Milvus (alias '{alias}')")
     return client
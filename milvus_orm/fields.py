@@ -3,14 +3,38 @@ Fields module for milvus_orm. Defines the Field classes used in Model definition
 """
 
 from abc import ABC, abstractmethod
+from array import array
 from typing import Any, List, Optional
 
+import numpy as np
 from pymilvus import DataType
 
+from ._kernels import METRIC_KERNELS
+from .utils import thaw
+
+try:
+    from ml_dtypes import bfloat16
+except ImportError:  # pragma: no cover - optional dependency
+    bfloat16 = None
+
+# Python types accepted by JsonField; the set serves exact-type lookups
+_JSON_TYPES = (dict, list, str, int, float, bool)
+_JSON_TYPE_SET = frozenset(_JSON_TYPES)
+
 
 class Field(ABC):
     """Base class for all field types in milvus_orm."""
 
+    __slots__ = (
+        "_name",
+        "_milvus_type_cache",
+        "primary_key",
+        "nullable",
+        "default",
+        "description",
+        "kwargs",
+    )
+
     MILVUS_TYPE: DataType
 
     def __init__(
@@ -21,6 +45,7 @@ class Field(ABC):
         description: str = "",
         **kwargs,
     ):
+        self._milvus_type_cache: Optional[dict] = None
         self.name = ""
         self.primary_key = primary_key
         self.nullable = nullable
@@ -36,9 +61,30 @@ class Field(ABC):
                 f"Primary key is not supported for field type {self.MILVUS_TYPE.name}"
             )
 
-    @abstractmethod
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str):
+        # The name is assigned by the model metaclass after construction
+        self._name = value
+        self._milvus_type_cache = None
+
+    def __set_name__(self, owner: type, name: str):
+        # Fields declared on plain classes (e.g. mixins) are named as well;
+        # model fields are named by the metaclass before the class is built
+        self.name = name
+
     def to_milvus_type(self) -> dict:
         """Convert field definition to Milvus SDK format."""
+        if self._milvus_type_cache is None:
+            self._milvus_type_cache = self._build_milvus_type()
+        return self._milvus_type_cache
+
+    @abstractmethod
+    def _build_milvus_type(self) -> dict:
+        """Build the Milvus SDK field definition."""
         pass
 
     @abstractmethod
@@ -46,10 +92,16 @@ class Field(ABC):
         """Validate if the value is compatible with the field type."""
         pass
 
+    def to_python(self, value: Any) -> Any:
+        """Convert a value to the representation stored on model instances."""
+        return value
+
 
 class IntegerField(Field):
     """Int64 field type."""
 
+    __slots__ = ("db_index", "index_type")
+
     MILVUS_TYPE = DataType.INT32
 
     def __init__(
@@ -66,7 +118,7 @@ class IntegerField(Field):
         self.db_index = db_index
         self.index_type = index_type
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
@@ -85,6 +137,8 @@ class IntegerField(Field):
 class BigIntField(IntegerField):
     """Int64 field type."""
 
+    __slots__ = ()
+
     MILVUS_TYPE = DataType.INT64
 
     def validate(self, value: Any) -> bool:
@@ -96,9 +150,11 @@ class BigIntField(IntegerField):
 class BooleanField(Field):
     """Boolean field type."""
 
+    __slots__ = ()
+
     MILVUS_TYPE = DataType.BOOL
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
@@ -116,6 +172,8 @@ class BooleanField(Field):
 class CharField(Field):
     """Variable character string field type."""
 
+    __slots__ = ("max_length", "enable_analyzer", "analyzer_params", "enable_match")
+
     MILVUS_TYPE = DataType.VARCHAR
 
     def __init__(
@@ -132,13 +190,14 @@ class CharField(Field):
         self.analyzer_params = analyzer_params
         self.enable_match = enable_match
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
             "max_length": self.max_length,
             "enable_analyzer": self.enable_analyzer,
-            "analyzer_params": self.analyzer_params,
+            # pymilvus serializes the params and cannot handle frozen mappings
+            "analyzer_params": thaw(self.analyzer_params),
             "enable_match": self.enable_match,
             "is_primary": self.primary_key,
             "nullable": self.nullable,
@@ -149,14 +208,17 @@ class CharField(Field):
     def validate(self, value: Any) -> bool:
         if value is None:
             return self.nullable
-        if not isinstance(value, str):
-            return False
-        return len(value) <= self.max_length
+        # The exact type check is the common case; isinstance keeps str subclasses valid
+        return (type(value) is str or isinstance(value, str)) and len(
+            value
+        ) <= self.max_length
 
 
 class UUIDField(CharField):
     """UUID field type."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         primary_key: bool = False,
@@ -177,17 +239,19 @@ class UUIDField(CharField):
     def validate(self, value: Any) -> bool:
         if value is None:
             return self.nullable or self.primary_key
-        if not isinstance(value, str):
-            return False
-        return len(value) <= self.max_length
+        return (type(value) is str or isinstance(value, str)) and len(
+            value
+        ) <= self.max_length
 
 
 class JsonField(Field):
     """JSON field type for storing structured data."""
 
+    __slots__ = ()
+
     MILVUS_TYPE = DataType.JSON
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
@@ -200,15 +264,17 @@ class JsonField(Field):
         if value is None:
             return self.nullable
         # In practice, we'll rely on Milvus to validate JSON format
-        return isinstance(value, (dict, list, str, int, float, bool))
+        return type(value) in _JSON_TYPE_SET or isinstance(value, _JSON_TYPES)
 
 
 class FloatField(Field):
     """Float field type."""
 
+    __slots__ = ()
+
     MILVUS_TYPE = DataType.FLOAT
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
@@ -226,6 +292,8 @@ class FloatField(Field):
 class VectorField(Field):
     """Base class for vector field types."""
 
+    __slots__ = ("index_type",)
+
     def __init__(self, index_type: Optional[str] = "AUTOINDEX", **kwargs):
         super().__init__(**kwargs)
         self.index_type = index_type
@@ -234,11 +302,17 @@ class VectorField(Field):
 class DenseVectorField(VectorField):
     """Base class for dense vector field types."""
 
+    __slots__ = ("dim", "_expected_shape")
+
+    # Element type of the arrays stored on model instances
+    NUMPY_DTYPE: Any = np.float32
+
     def __init__(self, dim: int, **kwargs):
         super().__init__(**kwargs)
         self.dim = dim
+        self._expected_shape = (dim,)
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
@@ -250,22 +324,180 @@ class DenseVectorField(VectorField):
     def validate(self, value: Any) -> bool:
         if value is None:
             return self.nullable
-        if not isinstance(value, list):
-            return False
-        if len(value) != self.dim:
-            return False
-        return all(isinstance(v, (int, float)) for v in value)
+        if isinstance(value, array):
+            # Typed buffers are homogeneous; only float and integer codes are numeric
+            return len(value) == self.dim and value.typecode in "fdbBhHiIlLqQ"
+        if not isinstance(value, np.ndarray):
+            if not isinstance(value, list) or len(value) != self.dim:
+                return False
+            # A single C-level conversion instead of a per-element Python loop;
+            # ragged or non-numeric input yields an error or a non-numeric dtype.
+            try:
+                value = np.asarray(value)
+            except (TypeError, ValueError):
+                return False
+        return value.shape == self._expected_shape and (
+            value.dtype.kind in "fiub" or value.dtype == self.NUMPY_DTYPE
+        )
+
+    def distance(
+        self, query: Any, candidates: Any, metric: str = "L2", backend: str = "cpu"
+    ) -> np.ndarray:
+        """
+        Compute distances between a query vector and candidate vectors client-side.
+
+        Args:
+            query: Query vector of length dim
+            candidates: Candidate vectors, one per row
+            metric: Metric type, one of L2, IP or COSINE
+            backend: "cpu", or "gpu" to use faiss when it is installed
+
+        Returns:
+            Array with one distance per candidate
+        """
+        metric = metric.upper()
+        kernel = METRIC_KERNELS.get(metric)
+        if kernel is None:
+            raise ValueError(f"Unsupported metric type: {metric}")
+        q = np.asarray(query, dtype=np.float32)
+        db = np.asarray(candidates, dtype=np.float32).reshape(-1, self.dim)
+
+        if backend == "gpu":
+            # Imported lazily so faiss is only loaded when requested
+            from .gpu import distance_batch
+
+            return distance_batch(db, q, metric)
+        if backend != "cpu":
+            raise ValueError(f"Unsupported backend: {backend}")
+        return kernel(db, q)
+
+    def to_query_data(self, vectors: Any) -> Any:
+        """
+        Convert query vectors to the form sent to client.search.
+
+        The vectors become one contiguous array of the field's element type,
+        converted in a single step; pymilvus picks the placeholder type from
+        the array dtype.
+
+        Args:
+            vectors: Vectors as a sequence of vectors or a 2D array
+
+        Returns:
+            2D array with one row per vector
+        """
+        arr = np.ascontiguousarray(vectors, dtype=self.NUMPY_DTYPE)
+        return arr.reshape(-1, self.dim)
+
+    def to_python(self, value: Any) -> Any:
+        # Keep vectors as contiguous typed buffers so inserts avoid
+        # serializing boxed Python floats one by one
+        if value is None:
+            return None
+        if isinstance(value, bytes):
+            # Half precision vectors are returned by Milvus as raw bytes
+            return np.frombuffer(value, dtype=self.NUMPY_DTYPE)
+        return np.asarray(value, dtype=self.NUMPY_DTYPE)
 
 
 class FloatVectorField(DenseVectorField):
     """Dense float vector field type."""
 
+    __slots__ = ()
+
     MILVUS_TYPE = DataType.FLOAT_VECTOR
 
+    def to_query_data(self, vectors: Any) -> Any:
+        # pymilvus packs float vectors element by element and is faster on
+        # lists than on arrays, so lists are passed through unchanged
+        if isinstance(vectors, list) and all(type(v) is list for v in vectors):
+            return vectors
+        return super().to_query_data(vectors)
+
+
+class Float16VectorField(DenseVectorField):
+    """Dense half precision (IEEE float16) vector field type."""
+
+    __slots__ = ()
+
+    MILVUS_TYPE = DataType.FLOAT16_VECTOR
+    NUMPY_DTYPE = np.float16
+
+
+class BFloat16VectorField(DenseVectorField):
+    """Dense bfloat16 vector field type, requires the ml_dtypes package."""
+
+    __slots__ = ()
+
+    MILVUS_TYPE = DataType.BFLOAT16_VECTOR
+    NUMPY_DTYPE = bfloat16
+
+    def __init__(self, dim: int, **kwargs):
+        if bfloat16 is None:
+            raise ImportError("BFloat16VectorField requires the ml_dtypes package")
+        super().__init__(dim, **kwargs)
+
+
+def _quantize_int8(values: np.ndarray, scale: float) -> np.ndarray:
+    """Scale float values and round them into the int8 range."""
+    return np.clip(np.rint(values * scale), -128, 127).astype(np.int8)
+
+
+class Int8VectorField(DenseVectorField):
+    """
+    Dense int8 vector field type.
+
+    With scale set, float vectors (stored and query vectors alike) are
+    quantized to round(value * scale) clipped to [-128, 127]; without it
+    values must already be integers.
+    """
+
+    __slots__ = ("scale",)
+
+    MILVUS_TYPE = DataType.INT8_VECTOR
+    NUMPY_DTYPE = np.int8
+
+    def __init__(self, dim: int, scale: Optional[float] = None, **kwargs):
+        super().__init__(dim, **kwargs)
+        self.scale = scale
+
+    def _check_values(self, value: np.ndarray) -> Optional[str]:
+        """Return why value cannot be stored as int8, or None if it can."""
+        if value.dtype.kind == "f":
+            if self.scale is None:
+                return "float vectors need a scale"
+            return None
+        # Integers are stored as they are; casting would wrap out-of-range ones
+        if value.size and (value.min() < -128 or value.max() > 127):
+            return "values must be within [-128, 127]"
+        return None
+
+    def validate(self, value: Any) -> bool:
+        if not super().validate(value):
+            return False
+        if value is None:
+            return True
+        return self._check_values(np.asarray(value)) is None
+
+    def to_query_data(self, vectors: Any) -> Any:
+        return super().to_query_data(self.to_python(vectors))
+
+    def to_python(self, value: Any) -> Any:
+        if value is None or isinstance(value, bytes):
+            return super().to_python(value)
+        value = np.asarray(value)
+        if (reason := self._check_values(value)) is not None:
+            raise ValueError(f"Invalid value for field {self.name}: {reason}")
+        scale = self.scale
+        if value.dtype.kind == "f" and scale is not None:
+            return _quantize_int8(value, scale)
+        return value.astype(np.int8, copy=False)
+
 
 class SparseFloatVectorField(Field):
     """Sparse float vector field type."""
 
+    __slots__ = ("input_fields",)
+
     MILVUS_TYPE = DataType.SPARSE_FLOAT_VECTOR
 
     def __init__(
@@ -278,7 +510,7 @@ class SparseFloatVectorField(Field):
             input_fields if isinstance(input_fields, list) else [input_fields]
         )
 
-    def to_milvus_type(self) -> dict:
+    def _build_milvus_type(self) -> dict:
         return {
             "name": self.name,
             "dtype": self.MILVUS_TYPE,
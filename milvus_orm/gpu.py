@@ -0,0 +1,64 @@
+"""
+Optional GPU backend for client-side distance computation, backed by faiss.
+
+faiss is not a required dependency; install a GPU build of faiss to enable it.
+When faiss or a CUDA device is unavailable the CPU kernels are used instead.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from ._kernels import METRIC_KERNELS
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+_resources: Optional["faiss.StandardGpuResources"] = None
+
+
+def is_available() -> bool:
+    """Check whether faiss with at least one CUDA device is available."""
+    return (
+        faiss is not None
+        and hasattr(faiss, "StandardGpuResources")
+        and faiss.get_num_gpus() > 0
+    )
+
+
+def _get_resources() -> "faiss.StandardGpuResources":
+    global _resources
+
+    if _resources is None:
+        _resources = faiss.StandardGpuResources()
+    return _resources
+
+
+def distance_batch(db: np.ndarray, q: np.ndarray, metric: str) -> np.ndarray:
+    """
+    Compute distances from q to each row of db on the GPU.
+
+    Args:
+        db: Candidate vectors as a float32 (N, dim) array
+        q: Query vector as a float32 (dim,) array
+        metric: Metric type, one of L2, IP or COSINE
+
+    Returns:
+        Array with one distance per candidate
+    """
+    if not is_available():
+        return METRIC_KERNELS[metric](db, q)
+
+    if metric == "COSINE":
+        db = db / np.linalg.norm(db, axis=1, keepdims=True)
+        q = q / np.linalg.norm(q)
+        metric = "IP"
+
+    return faiss.pairwise_distance_gpu(
+        _get_resources(),
+        np.ascontiguousarray(q[None], dtype=np.float32),
+        np.ascontiguousarray(db, dtype=np.float32),
+        metric=faiss.METRIC_L2 if metric == "L2" else faiss.METRIC_INNER_PRODUCT,
+    )[0]
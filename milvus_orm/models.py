@@ -2,32 +2,205 @@
 Models module for milvus_orm. Defines the Model base class and related functionality.
 """
 
+import asyncio
+import types
 import uuid
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from pymilvus import CollectionSchema, FieldSchema, Function, FunctionType
 from pymilvus.grpc_gen import common_pb2
 from pymilvus.milvus_client.index import IndexParams
 
-from .client import ensure_connection
+from .client import DEFAULT_ALIAS, ensure_connection, get_client_sync
 from .exceptions import NotContainsVectorField
 from .fields import (
     BigIntField,
+    BooleanField,
     CharField,
     Field,
+    FloatField,
     IntegerField,
     SparseFloatVectorField,
     UUIDField,
     VectorField,
 )
-from .query import QuerySet
-from .utils import classproperty
+from .query import QuerySet, _forget_loaded
+from .utils import classproperty, loop_lock
 
 ConsistencyLevel = common_pb2.ConsistencyLevel
 
 
 M = TypeVar("M", bound="Model")
 
+# Per-instance attributes besides the field values
+_INSTANCE_SLOTS = ("_extra_fields", "_collection_name", "_distance")
+
+# (connection alias, collection name) pairs known to exist, so writes can
+# skip the has_collection round-trip
+_known_collections: Set[Tuple[str, str]] = set()
+# Guards create_collection per (connection alias, collection name)
+_collection_locks: Dict[
+    Tuple[str, str], Tuple[asyncio.AbstractEventLoop, asyncio.Lock]
+] = {}
+
+
+def _invalid_value(field_name: str, field: Field, value: Any) -> ValueError:
+    """Build the error raised when a value fails field validation."""
+    if (
+        isinstance(field, CharField)
+        and isinstance(value, str)
+        and len(value) > field.max_length
+    ):
+        return ValueError(
+            f"Value for field '{field_name}' exceeds max_length ({field.max_length})"
+        )
+    # Report the type only; the repr of a large vector would flood the message
+    return ValueError(
+        f"Invalid value for field '{field_name}' (type={type(value).__name__})"
+    )
+
+
+def _extra_fields(data: Dict[str, Any], field_names: FrozenSet[str]) -> Dict[str, Any]:
+    """Return the entries of data that are not model fields."""
+    if data.keys() <= field_names:
+        return {}
+    return {k: v for k, v in data.items() if k not in field_names}
+
+
+def _inline_check(field: Field) -> Optional[str]:
+    """
+    Return a Python expression equivalent to field.validate(v) for a non-None v.
+
+    Only the built-in scalar validators are inlined; any other validator,
+    including an override in a Field subclass, returns None.
+    """
+    validate = type(field).validate
+    if validate in (IntegerField.validate, BigIntField.validate):
+        return "isinstance(v, int)"
+    if validate is BooleanField.validate:
+        return "isinstance(v, bool)"
+    if validate is FloatField.validate:
+        return "isinstance(v, (int, float))"
+    if validate in (CharField.validate, UUIDField.validate) and isinstance(
+        field, CharField
+    ):
+        return f"isinstance(v, str) and len(v) <= {int(field.max_length)}"
+    return None
+
+
+class _FieldSlot:
+    """
+    Class attribute of a model field whose value is stored in a slot.
+
+    Accessed on the class it returns the Field, e.g. Product.vector.dim;
+    on an instance it reads and writes the slot it replaces.
+    """
+
+    __slots__ = ("field", "member")
+
+    def __init__(self, field: Field, member: Any):
+        self.field = field
+        self.member = member
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self.field
+        return self.member.__get__(instance, owner)
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        self.member.__set__(instance, value)
+
+    def __delete__(self, instance: Any) -> None:
+        self.member.__delete__(instance)
+
+
+def _build_fast_init(fields: Dict[str, Field], slots: Dict[str, _FieldSlot]):
+    """
+    Generate a function that validates and assigns every field of a model.
+
+    The field names, defaults and validators are bound as constants of the
+    generated code, so constructing an instance does not iterate _fields.
+    Scalar type checks are inlined instead of calling Field.validate.
+    Primary key and required fields are checked first. Fields stored in
+    slots are written through the slot directly.
+    """
+    namespace: Dict[str, Any] = {"_invalid_value": _invalid_value}
+    lines = ["def _fast_init(self, d, _from_result):"]
+
+    ordered = sorted(
+        fields.items(), key=lambda item: (not item[1].primary_key, item[1].nullable)
+    )
+    for i, (field_name, field) in enumerate(ordered):
+        if isinstance(field, SparseFloatVectorField):
+            continue
+        namespace[f"_field{i}"] = field
+        namespace[f"_default{i}"] = field.default
+        lines.append(f"    v = d.get({field_name!r}, _default{i})")
+        if (check := _inline_check(field)) is None:
+            namespace[f"_validate{i}"] = field.validate
+            lines.append(f"    if not _from_result and not _validate{i}(v):")
+        elif field.validate(None):
+            lines.append(
+                f"    if not _from_result and v is not None and not ({check}):"
+            )
+        else:
+            lines.append(f"    if not _from_result and (v is None or not ({check})):")
+        lines.append(f"        raise _invalid_value({field_name!r}, _field{i}, v)")
+        if type(field).to_python is not Field.to_python:
+            namespace[f"_to_python{i}"] = field.to_python
+            lines.append(f"    v = _to_python{i}(v)")
+        if field_name in slots:
+            namespace[f"_set{i}"] = slots[field_name].member.__set__
+            lines.append(f"    _set{i}(self, v)")
+        else:
+            lines.append(f"    self.{field_name} = v")
+    lines.append("    return None")
+
+    exec("\n".join(lines), namespace)
+    return namespace["_fast_init"]
+
+
+def _build_to_dict(fields: Dict[str, Field]):
+    """
+    Generate a to_dict method that reads the model fields by name.
+
+    Equivalent to Model.to_dict, with the field loop and type checks
+    resolved once when the class is created.
+    """
+    namespace: Dict[str, Any] = {"uuid4": uuid.uuid4}
+    lines = ["def to_dict(self):", "    d = {}"]
+
+    for field_name, field in fields.items():
+        if isinstance(field, SparseFloatVectorField):
+            continue
+        lines.append(f"    v = getattr(self, {field_name!r}, None)")
+        lines.append("    if v is not None:")
+        lines.append(f"        d[{field_name!r}] = v")
+        if isinstance(field, UUIDField):
+            lines.append("    else:")
+            lines.append(f"        d[{field_name!r}] = str(uuid4())")
+    lines.append("    e = getattr(self, '_extra_fields', None)")
+    lines.append("    if e:")
+    lines.append("        d.update(e)")
+    lines.append("    return d")
+
+    exec("\n".join(lines), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert model instance to dictionary."
+    return to_dict
+
 
 class ModelMeta(type):
     """Metaclass for Model that processes fields and creates schema."""
@@ -41,18 +214,14 @@ class ModelMeta(type):
         fields = {}
         primary_key_field = None
 
-        contains_vector_field = False
-
         for key, value in attrs.items():
             if isinstance(value, Field):
                 value.name = key
                 fields[key] = value
                 if value.primary_key:
                     primary_key_field = key
-            if not contains_vector_field and isinstance(value, VectorField):
-                contains_vector_field = True
 
-        if not contains_vector_field:
+        if not any(isinstance(field, VectorField) for field in fields.values()):
             raise NotContainsVectorField(
                 "Model must contain at least one vector field."
             )
@@ -69,25 +238,57 @@ class ModelMeta(type):
         )
 
         attrs["Meta"] = MetaInfo(**meta_info_params)
+        # Resolved once so requests skip the Meta lookup
+        attrs["_connection_alias"] = attrs["Meta"].connection_alias
 
         # If no primary key is defined, add a default one
         if not primary_key_field:
             id_field = UUIDField(primary_key=True)
             id_field.name = "id"
             fields["id"] = id_field
-            attrs["id"] = id_field
             primary_key_field = "id"
 
+        # Store field values in slots; the Field objects are put back as
+        # _FieldSlot descriptors once the class is built, since a class
+        # attribute would conflict with its slot
+        if "__slots__" not in attrs:
+            for key in fields:
+                attrs.pop(key, None)
+            attrs["__slots__"] = tuple(fields) + _INSTANCE_SLOTS
+
         # Add schema metadata to the class
         attrs["_fields"] = fields
+        # Tuple view of _fields for iteration; _fields stays the name lookup
+        attrs["_fields_tuple"] = tuple(fields.items())
+        # Fields returned by queries; sparse vectors are generated server-side
+        attrs["_non_sparse_fields"] = tuple(
+            k for k, v in fields.items() if not isinstance(v, SparseFloatVectorField)
+        )
         attrs["_primary_key_field"] = primary_key_field
+        # The key is bound as the "pk" filter template parameter
+        attrs["_delete_filter"] = primary_key_field + " == {pk}"
+        attrs["_field_names"] = frozenset(fields)
+        attrs.setdefault("to_dict", _build_to_dict(fields))
+        # Built lazily on first use, see Model._get_schema/_get_index_params
+        attrs["_schema_cached"] = None
+        attrs["_index_params_cached"] = None
+        attrs["_base_queryset"] = None
 
         # Determine collection name (use class name if not specified)
         collection_name = attrs.get("collection_name", name.lower())
         attrs["collection_name"] = collection_name
 
         # Create the class
-        return super().__new__(mcs, name, bases, attrs)
+        cls = super().__new__(mcs, name, bases, attrs)
+
+        slots = {}
+        for key, field in fields.items():
+            member = cls.__dict__.get(key)
+            if isinstance(member, types.MemberDescriptorType):
+                slots[key] = _FieldSlot(field, member)
+                setattr(cls, key, slots[key])
+        setattr(cls, "_fast_init", _build_fast_init(fields, slots))
+        return cls
 
 
 class MetaInfo:
@@ -101,11 +302,13 @@ class MetaInfo:
         enable_dynamic_field: bool = False,
         consistency_level: str = ConsistencyLevel.Session,
         dynamic: bool = False,
+        connection_alias: str = DEFAULT_ALIAS,
     ):
         self.collection_name = collection_name
         self.enable_dynamic_field = enable_dynamic_field
         self.consistency_level = consistency_level
         self.dynamic = dynamic
+        self.connection_alias = connection_alias
 
 
 class Model(object, metaclass=ModelMeta):
@@ -114,9 +317,21 @@ class Model(object, metaclass=ModelMeta):
     Mapping to collection in Milvus.
     """
 
+    __slots__ = ()
+
     # Will be set by metaclass
     _fields: Dict[str, Field] = {}
+    _fields_tuple: Tuple[Tuple[str, Field], ...] = ()
+    _non_sparse_fields: Tuple[str, ...] = ()
+    _field_names: FrozenSet[str] = frozenset()
     _primary_key_field: str = "id"
+    _connection_alias: str = DEFAULT_ALIAS
+    _delete_filter: str = "id == {pk}"
+    _schema_cached: Optional[CollectionSchema] = None
+    _index_params_cached: Optional[IndexParams] = None
+    _base_queryset: Optional[QuerySet] = None
+    _fast_init: Callable[..., None]
+    collection_name: str
 
     id: UUIDField
 
@@ -131,33 +346,41 @@ class Model(object, metaclass=ModelMeta):
     ):
         """Initialize a model instance with field values."""
         # Validate and set field values
-        for field_name, field in self._fields.items():
-            if isinstance(field, SparseFloatVectorField):
-                continue
-            value = kwargs.get(field_name, field.default)
-            if not field.validate(value) and not _from_result:
-                if (
-                    isinstance(field, CharField)
-                    and isinstance(value, str)
-                    and len(value) > field.max_length
-                ):
-                    raise ValueError(
-                        f"Value for field '{field_name}' exceeds max_length ({field.max_length})"
-                    )
-                else:
-                    raise ValueError(f"Invalid value for field '{field_name}': {value}")
-            setattr(self, field_name, value)
+        self._fast_init(kwargs, _from_result)
 
         # Store any extra fields in dynamic field if enabled
-        self._extra_fields = {k: v for k, v in kwargs.items() if k not in self._fields}
+        self._extra_fields = _extra_fields(kwargs, self._field_names)
 
         self._collection_name = _collection_name
         self._distance = _distance
 
+    @classmethod
+    def _from_result_fast(cls: Type[M], data: Dict[str, Any], distance=None) -> M:
+        """Build an instance from a row returned by Milvus.
+
+        Equivalent to cls(_from_result=True, _distance=distance, **data),
+        without repacking the row into keyword arguments or validating it.
+        """
+        instance = object.__new__(cls)
+        instance._fast_init(data, True)
+        instance._extra_fields = _extra_fields(data, cls._field_names)
+        instance._collection_name = None
+        instance._distance = distance
+        return instance
+
+    @classmethod
+    def _from_hit(cls: Type[M], hit: Any) -> M:
+        """Build an instance from a search hit.
+
+        Hits are dicts holding the row under "entity"; reading it by key
+        avoids the attribute fallbacks and to_dict() of the pymilvus Hit.
+        """
+        return cls._from_result_fast(hit["entity"], hit["distance"])
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary."""
         data = {}
-        for field_name, field in self._fields.items():
+        for field_name, field in self._fields_tuple:
             if isinstance(field, SparseFloatVectorField):
                 continue
             value = getattr(self, field_name, None)
@@ -175,12 +398,19 @@ class Model(object, metaclass=ModelMeta):
         return data
 
     @classmethod
-    def _get_schema(cls) -> Dict[str, Any]:
+    def _get_schema(cls) -> CollectionSchema:
+        """Return the Milvus schema of the model, building it on first use."""
+        if cls._schema_cached is None:
+            cls._schema_cached = cls._build_schema()
+        return cls._schema_cached
+
+    @classmethod
+    def _build_schema(cls) -> CollectionSchema:
         """Generate Milvus schema from model fields."""
 
         fields = []
         functions = []
-        for field in cls._fields.values():
+        for _, field in cls._fields_tuple:
             field_schema = FieldSchema(**field.to_milvus_type())
             fields.append(field_schema)
             if isinstance(field, SparseFloatVectorField):
@@ -204,9 +434,16 @@ class Model(object, metaclass=ModelMeta):
 
     @classmethod
     def _get_index_params(cls) -> IndexParams:
+        """Return the index params of the model, building them on first use."""
+        if cls._index_params_cached is None:
+            cls._index_params_cached = cls._build_index_params()
+        return cls._index_params_cached
+
+    @classmethod
+    def _build_index_params(cls) -> IndexParams:
         """Generate index params for collection."""
         index_params = IndexParams()
-        for field_name, field in cls._fields.items():
+        for field_name, field in cls._fields_tuple:
             if isinstance(field, SparseFloatVectorField):
                 index_params.add_index(
                     field_name=field_name,
@@ -234,23 +471,33 @@ class Model(object, metaclass=ModelMeta):
         if cls.Meta.dynamic and not collection_name:
             raise ValueError("Dynamic collection must specify collection_name")
 
-        client = await ensure_connection()
+        alias = cls._connection_alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
         schema = cls._get_schema()
         index_params = cls._get_index_params()
 
         collection_name = collection_name or cls.Meta.collection_name
-
-        # Check if collection already exists
-        if await client.has_collection(collection_name=collection_name):
-            return False
-
-        # Create the collection
-        await client.create_collection(
-            collection_name=collection_name,
-            schema=schema,
-            index_params=index_params,
-            consistency_level=cls.Meta.consistency_level,
-        )
+        key = (alias, collection_name)
+
+        # Serialize concurrent creates of the same collection so only one
+        # coroutine probes and creates it; the others see it as known
+        async with loop_lock(_collection_locks, key):
+            if key in _known_collections:
+                return False
+
+            # Check if collection already exists
+            if await client.has_collection(collection_name=collection_name):
+                _known_collections.add(key)
+                return False
+
+            # Create the collection
+            await client.create_collection(
+                collection_name=collection_name,
+                schema=schema,
+                index_params=index_params,
+                consistency_level=cls.Meta.consistency_level,
+            )
+            _known_collections.add(key)
         return True
 
     @classmethod
@@ -259,10 +506,14 @@ class Model(object, metaclass=ModelMeta):
         if cls.Meta.dynamic and not collection_name:
             raise ValueError("Dynamic collection must specify collection_name")
 
-        client = await ensure_connection()
+        alias = cls._connection_alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
 
         collection_name = collection_name or cls.Meta.collection_name
 
+        _known_collections.discard((alias, collection_name))
+        _forget_loaded(alias, collection_name)
+
         # Check if collection exists
         if not await client.has_collection(collection_name=collection_name):
             return False
@@ -272,51 +523,73 @@ class Model(object, metaclass=ModelMeta):
         return True
 
     @classmethod
-    async def bulk_create(cls, instances: List["Model"]) -> int:
+    async def bulk_create(
+        cls, instances: List["Model"], collection_name: Optional[str] = None
+    ) -> int:
         """Bulk create multiple model instances.
 
+        All rows are sent to Milvus in a single insert request.
+
         Args:
             instances: List of model instances to create
+            collection_name: Target collection, required for dynamic models
 
         Returns:
             Number of instances created
         """
+        if cls.Meta.dynamic and not collection_name:
+            raise ValueError("Dynamic collection must specify collection_name")
+
         if not instances:
             return 0
 
-        client = await ensure_connection()
+        alias = cls._connection_alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        collection_name = collection_name or cls.Meta.collection_name
 
         # Check if collection exists, create if not
-        if not await client.has_collection(collection_name=cls.Meta.collection_name):
-            await cls.create_collection()
+        if (alias, collection_name) not in _known_collections:
+            await cls.create_collection(collection_name)
 
         # Convert instances to dictionaries
         data = [instance.to_dict() for instance in instances]
 
         # Insert data in bulk
-        result = await client.insert(
-            collection_name=cls.Meta.collection_name, data=data
-        )
+        result = await client.insert(collection_name=collection_name, data=data)
 
         # Update primary keys if auto_id is enabled
         primary_key = cls._primary_key_field
-        primary_key_values = result.get("primary_keys", [])
+        primary_key_values = result.get("ids", [])
 
-        if primary_key_values:
-            for i, instance in enumerate(instances):
-                if i < len(primary_key_values) and (
-                    not hasattr(instance, primary_key)
-                    or getattr(instance, primary_key) is None
-                ):
-                    setattr(instance, primary_key, primary_key_values[i])
+        for instance, pk_value in zip(instances, primary_key_values, strict=True):
+            if getattr(instance, primary_key, None) is None:
+                setattr(instance, primary_key, pk_value)
 
         return result.get("insert_count", 0)
 
+    @classmethod
+    async def bulk_get(cls: Type[M], ids: List[Any], chunk: int = 1024) -> List[M]:
+        """Fetch instances by primary key with one query per chunk of ids.
+
+        Args:
+            ids: Primary key values to fetch
+            chunk: Maximum number of keys per query
+
+        Returns:
+            Instances found, in the order of ids; missing keys are skipped
+        """
+        return await cls.objects.bulk_get(ids, chunk=chunk)
+
     @classproperty
     def objects(cls: Type[M]) -> "QuerySet[M]":
         """Return a QuerySet for the model."""
-
-        return QuerySet(cls)
+        # QuerySet builders always return a new instance, so the unfiltered
+        # base query set can be shared by every access
+        qs = cls._base_queryset
+        if qs is None:
+            qs = cls._base_queryset = QuerySet(cls)
+        return qs
 
     if TYPE_CHECKING:
 
@@ -334,32 +607,34 @@ class Model(object, metaclass=ModelMeta):
     async def save(self, auto_create_collection: bool = False) -> bool:
         """Save model instance to Milvus."""
         # Check if collection exists, create if not
-        client = await ensure_connection()
-
-        if not await client.has_collection(collection_name=self.get_collection_name()):
-            if auto_create_collection:
-                await self.create_collection()
+        alias = self._connection_alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        collection_name = self.get_collection_name()
+        if (alias, collection_name) not in _known_collections:
+            if await client.has_collection(collection_name=collection_name):
+                _known_collections.add((alias, collection_name))
+            elif auto_create_collection:
+                await self.create_collection(collection_name)
             else:
-                raise ValueError(
-                    f"Collection {self.get_collection_name()} does not exist"
-                )
+                raise ValueError(f"Collection {collection_name} does not exist")
 
         # Convert to dict and insert
         result = await client.insert(
-            collection_name=self.get_collection_name(), data=[self.to_dict()]
+            collection_name=collection_name, data=[self.to_dict()]
         )
 
         # Update primary key if auto_id is enabled
         primary_key = self._primary_key_field
-        if not hasattr(self, primary_key) or getattr(self, primary_key) is None:
-            if result.get("insert_count", 0) > 0:
-                setattr(self, primary_key, result.get(f"{primary_key}s", [None])[0])
+        if getattr(self, primary_key, None) is None and (ids := result.get("ids")):
+            setattr(self, primary_key, ids[0])
 
         return result.get("insert_count", 0) > 0
 
     async def delete(self) -> bool:
         """Delete model instance from Milvus."""
-        client = await ensure_connection()
+        alias = self._connection_alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
         primary_key = self._primary_key_field
         pk_value = getattr(self, primary_key, None)
 
@@ -368,14 +643,16 @@ class Model(object, metaclass=ModelMeta):
 
         result = await client.delete(
             collection_name=self.get_collection_name(),
-            filter=f"{primary_key} == {pk_value}",
+            filter=self._delete_filter,
+            filter_params={"pk": pk_value},
         )
 
         return result.get("delete_count", 0) > 0
 
     async def update(self, **kwargs) -> bool:
         """Update model instance with new values."""
-        client = await ensure_connection()
+        alias = self._connection_alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
 
         primary_key = self._primary_key_field
         pk_value = getattr(self, primary_key, None)
@@ -388,8 +665,8 @@ class Model(object, metaclass=ModelMeta):
             if field_name in self._fields:
                 field = self._fields[field_name]
                 if not field.validate(value):
-                    raise ValueError(f"Invalid value for field '{field_name}': {value}")
-                setattr(self, field_name, value)
+                    raise _invalid_value(field_name, field, value)
+                setattr(self, field_name, field.to_python(value))
             else:
                 # Add to extra fields for dynamic schema
                 if not hasattr(self, "_extra_fields"):
@@ -402,3 +679,16 @@ class Model(object, metaclass=ModelMeta):
             consistency_level=self.Meta.consistency_level,
             partial_update=True,
         )
+
+
+async def create_all(*models: Type[Model]) -> List[bool]:
+    """
+    Create the collections of several models concurrently.
+
+    Args:
+        *models: Model classes whose collections should be created
+
+    Returns:
+        One result per model, as returned by Model.create_collection
+    """
+    return list(await asyncio.gather(*(m.create_collection() for m in models)))
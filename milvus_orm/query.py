@@ -2,46 +2,374 @@
 Query module for milvus_orm. Defines the QuerySet class for async query operations.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Generic, List, Optional, Type, TypeVar
+import asyncio
+import inspect
+import json
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import numpy as np
+from pymilvus.exceptions import MilvusException
 
 from milvus_orm.exceptions import DoesNotExist, MultipleObjectsReturned
 
-from .client import ensure_connection
-from .fields import SparseFloatVectorField
+from .cache import QueryEmbeddingCache
+from .client import ensure_connection, get_client_sync
+from .fields import DenseVectorField
+from .utils import loop_lock
+
+try:
+    # Private pymilvus names, checked against pymilvus 2.6.0 to 3.0.2
+    from pymilvus.client.constants import ITERATOR_FIELD, REDUCE_STOP_FOR_BEST
+except ImportError:  # pragma: no cover - depends on the pymilvus release
+    # The keys the server reads the options under
+    ITERATOR_FIELD = "iterator"
+    REDUCE_STOP_FOR_BEST = "reduce_stop_for_best"
 
 if TYPE_CHECKING:
+    from pymilvus import AsyncMilvusClient
+
     from .models import Model
 
 M = TypeVar("M", bound="Model")
 
+# A filter node: (negated, raw expression, lookup keys, lookup values)
+_Cond = Tuple[bool, Optional[str], Tuple[str, ...], Tuple[Any, ...]]
+
+# Query options QuerySet.iterator sends to get rows in primary key order
+_ITERATOR_OPTIONS: Dict[str, Any] = {
+    ITERATOR_FIELD: "True",
+    REDUCE_STOP_FOR_BEST: "True",
+}
+
+# Keys of QuerySet._search_params that are not forwarded to client.search
+_RESERVED_SEARCH_PARAMS = frozenset(
+    {
+        "vector",
+        "data",
+        "text",
+        "embedder",
+        "cache",
+        "field_name",
+        "limit",
+        "offset",
+        "filter",
+    }
+)
+
+
+# Seconds a collection found loaded is trusted before checking again
+LOADED_STATE_TTL = 60.0
+
+# (connection alias, collection name) -> monotonic time the loaded state expires
+_loaded_until: Dict[Tuple[str, str], float] = {}
+_load_locks: Dict[Tuple[str, str], Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+
+
+# Milvus error codes for a collection that is not found or not loaded
+_STALE_STATE_CODES = frozenset({100, 101})
+
+
+def _forget_loaded(alias: str, collection_name: str) -> None:
+    """Drop the cached loaded state of a collection, e.g. after it is dropped."""
+    _loaded_until.pop((alias, collection_name), None)
+
+
+def _render_literal(value: Any) -> str:
+    """Render a Python value as a Milvus filter expression literal."""
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return "[" + ", ".join(map(_render_literal, value)) + "]"
+    return str(value)
+
+
+def _escape_like(value: Any) -> str:
+    """Escape LIKE wildcards so the value is matched literally."""
+    return str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+# Lookup suffix -> (Milvus operator, literal renderer). Lookups without a
+# renderer bind their value as a filter template parameter; like patterns
+# must be string literals in Milvus, so they are rendered inline.
+_LOOKUPS: Dict[str, Tuple[str, Optional[Callable[[Any], str]]]] = {
+    "exact": ("==", None),
+    "ne": ("!=", None),
+    "gt": (">", None),
+    "gte": (">=", None),
+    "lt": ("<", None),
+    "lte": ("<=", None),
+    "in": ("in", None),
+    "contains": ("like", lambda v: _render_literal(f"%{_escape_like(v)}%")),
+    "startswith": ("like", lambda v: _render_literal(f"{_escape_like(v)}%")),
+    "endswith": ("like", lambda v: _render_literal(f"%{_escape_like(v)}")),
+}
+
+
+def _bind_value(value: Any) -> Any:
+    """Convert a lookup value to a type accepted as a filter template value."""
+    if isinstance(value, np.ndarray):
+        # One C-level conversion; pymilvus rejects arrays as template values
+        return value.tolist()
+    if isinstance(value, (tuple, set, frozenset, range)):
+        return list(value)
+    return value
+
+
+def _compile_lookups(
+    keys: Tuple[str, ...], literal: int, param: int
+) -> Tuple[str, List[Optional[Callable]]]:
+    """
+    Compile lookup keys such as ("title__contains", "id__gt").
+
+    Returns a format template and one renderer per key. Keys with a renderer
+    get a positional slot for their literal, numbered from literal; the
+    others are bound to the template parameters _v{param}, _v{param + 1}, ...
+    """
+    parts = []
+    renderers = []
+    for key in keys:
+        field_name, _, lookup = key.partition("__")
+        if (lookup_info := _LOOKUPS.get(lookup or "exact")) is None:
+            raise ValueError(f"Unsupported lookup '{lookup}' in '{key}'")
+        operator, renderer = lookup_info
+        if renderer is None:
+            parts.append(f"{field_name} {operator} {{{{_v{param}}}}}")
+            param += 1
+        else:
+            parts.append(f"{field_name} {operator} {{{literal}}}")
+            literal += 1
+        renderers.append(renderer)
+    return " && ".join(parts), renderers
+
+
+@lru_cache(maxsize=1024)
+def _compile_shape(
+    shape: Tuple[Tuple[bool, Optional[str], Tuple[str, ...]], ...],
+) -> Tuple[Optional[str], Tuple[Optional[Callable], ...]]:
+    """
+    Compile the shape of a filter, its nodes without lookup values, once.
+
+    Returns a format template for the whole expression (None without nodes)
+    and the renderers for the lookup values in node order. The template does
+    not depend on the values, so pagination loops and repeated queries of
+    the same shape reuse it.
+    """
+    parts = []
+    renderers: List[Optional[Callable]] = []
+    literals = 0
+    for negated, expr, keys in shape:
+        if expr:
+            # Raw expressions are not templates; escape braces for format()
+            expr = expr.replace("{", "{{").replace("}", "}}")
+        if keys:
+            lookup_expr, node_renderers = _compile_lookups(
+                keys, literals, len(renderers) - literals
+            )
+            literals += sum(r is not None for r in node_renderers)
+            renderers.extend(node_renderers)
+            expr = f"({expr}) && {lookup_expr}" if expr else lookup_expr
+        parts.append(f"not ({expr})" if negated else expr)
+
+    if not parts:
+        return None, ()
+    if len(parts) == 1:
+        return parts[0], tuple(renderers)
+    return "(" + ") && (".join(parts) + ")", tuple(renderers)
+
+
+@dataclass(frozen=True, slots=True)
+class SearchQuery:
+    """One query vector of a batch_search() call with its own settings.
+
+    Unset values fall back to those of the query set.
+    """
+
+    vector: Any
+    limit: Optional[int] = None
+    # Raw filter expression combined with the query set filter
+    filter: Optional[str] = None
+    # Passed to client.search as search_params, e.g. {"params": {"ef": 64}}
+    search_params: Optional[Dict[str, Any]] = None
+
+
+def _cond_sort_key(cond: _Cond) -> Tuple[bool, str, Tuple[str, ...]]:
+    negated, expr, keys, _ = cond
+    return negated, expr or "", keys
+
+
+# Range lookup -> (is lower bound, is strict)
+_BOUNDS = {
+    "gt": (True, True),
+    "gte": (True, False),
+    "lt": (False, True),
+    "lte": (False, False),
+}
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Equality that never compares arrays element-wise."""
+    if a is b:
+        return True
+    if type(a) is not type(b) or isinstance(a, np.ndarray):
+        return False
+    return a == b
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _tighten(lookups: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    """Keep the tightest numeric bound per field and side, drop implied ins."""
+    result: List[Tuple[str, Any]] = []
+    bound_at: Dict[Tuple[str, bool], int] = {}
+    exact: Dict[str, Any] = {}
+    for key, value in lookups:
+        field_name, _, lookup = key.partition("__")
+        if lookup in ("", "exact"):
+            exact[field_name] = value
+        bound = _BOUNDS.get(lookup)
+        if bound is None or not _is_number(value):
+            result.append((key, value))
+            continue
+        lower, strict = bound
+        i = bound_at.get((field_name, lower))
+        if i is None:
+            bound_at[(field_name, lower)] = len(result)
+            result.append((key, value))
+            continue
+        current = result[i][1]
+        if (value > current if lower else value < current) or (
+            value == current and strict
+        ):
+            result[i] = (key, value)
+
+    if exact:
+        # field == v already implies field in [..., v, ...]
+        result = [
+            (key, value)
+            for key, value in result
+            if not (
+                key.endswith("__in")
+                and key[:-4] in exact
+                and any(_same_value(v, exact[key[:-4]]) for v in value)
+            )
+        ]
+    return result
+
+
+def _normalize(conds: Tuple[_Cond, ...]) -> List[_Cond]:
+    """
+    Simplify filter nodes before they are compiled.
+
+    Plain lookup nodes are merged into a single node with duplicates
+    removed, range lookups collapsed to the tightest bound per field and
+    in lookups implied by an exact lookup dropped. Negated nodes and nodes
+    with a raw expression are only deduplicated.
+    """
+    lookups: List[Tuple[str, Any]] = []
+    others: List[_Cond] = []
+    for cond in conds:
+        negated, expr, keys, values = cond
+        if negated or expr:
+            if not any(
+                other[:3] == cond[:3] and all(map(_same_value, other[3], values))
+                for other in others
+            ):
+                others.append(cond)
+            continue
+        for key, value in zip(keys, values, strict=True):
+            if not any(k == key and _same_value(v, value) for k, v in lookups):
+                lookups.append((key, value))
+
+    if lookups:
+        items = sorted(_tighten(lookups), key=lambda item: item[0])
+        others.append(
+            (
+                False,
+                None,
+                tuple(key for key, _ in items),
+                tuple(value for _, value in items),
+            )
+        )
+    return others
+
 
 class QuerySet(Generic[M]):
     """Async query set for Milvus models."""
 
+    __slots__ = (
+        "model_class",
+        "_conds",
+        "_compiled",
+        "_limit",
+        "_limited",
+        "_offset",
+        "_output_fields",
+        "_search_params",
+        "_vector_field",
+        "_model_fields",
+        "_defer_fields",
+        "_consistency_level",
+        "_collection_name",
+        "_default_collection_name",
+        "_alias",
+    )
+
     def __init__(self, model_class: Type[M]):
         self.model_class = model_class
-        self._filter: Optional[str] = None
+        # Filter nodes as (negated, expr, lookup keys, lookup values); the
+        # expression string is only built when a request is sent
+        self._conds: Tuple[_Cond, ...] = ()
+        # (expression, template parameters) compiled from _conds on first use
+        self._compiled: Optional[Tuple[Optional[str], Dict[str, Any]]] = None
         self._limit: int = 1000
+        # Whether limit() or a slice set _limit; iterator() ignores the default
+        self._limited: bool = False
         self._offset: int = 0
         self._output_fields: Optional[List[str]] = None
         self._search_params: Optional[Dict[str, Any]] = None
         self._vector_field: Optional[str] = None
 
         self._model_fields: Optional[List[str]] = None
-        self._defer_fields: List[str] = []
+        self._defer_fields: FrozenSet[str] = frozenset()
 
-        self._consistency_level: Optional[str] = None
+        # Meta values are resolved once here instead of on every request
+        meta = model_class.Meta
+        self._consistency_level = meta.consistency_level
+        self._alias: str = model_class._connection_alias
         self._collection_name: Optional[str] = None
+        # None for dynamic models, which must name the collection explicitly
+        self._default_collection_name: Optional[str] = (
+            None if meta.dynamic else meta.collection_name
+        )
 
     def get_collection_name(self) -> str:
         """Get the collection name to query."""
-        if self.model_class.Meta.dynamic and not self._collection_name:
+        collection_name = self._collection_name or self._default_collection_name
+        if collection_name is None:
             raise ValueError("Dynamic collection must specify collection_name")
-        return (
-            self._collection_name
-            if self._collection_name
-            else self.model_class.Meta.collection_name
-        )
+        return collection_name
 
     async def create(self, **kwargs) -> M:
         """Create a new instance of the model."""
@@ -51,22 +379,97 @@ class QuerySet(Generic[M]):
         await instance.save()
         return instance
 
+    async def bulk_create(self, instances: List[M]) -> int:
+        """Create multiple instances with a single insert request."""
+        return await self.model_class.bulk_create(
+            instances, collection_name=self.get_collection_name()
+        )
+
     def on(self, collection_name: str) -> "QuerySet[M]":
         """Set the collection name to query."""
         qs = self._clone()
         qs._collection_name = collection_name
         return qs
 
-    def filter(self, expr: str) -> "QuerySet[M]":
-        """Add filter expression to the query."""
+    def filter(self, expr: Optional[str] = None, **lookups: Any) -> "QuerySet[M]":
+        """
+        Add filter expression and/or field lookups to the query.
+
+        Lookups use the form field__op=value, e.g. price__gt=10 or
+        title__contains="Python"; chained filters are combined with &&.
+        """
+        return self._add_cond(False, expr, lookups)
+
+    def exclude(self, expr: Optional[str] = None, **lookups: Any) -> "QuerySet[M]":
+        """
+        Exclude instances matching the expression and/or field lookups.
+
+        Takes the same arguments as filter(); the condition is negated.
+        """
+        return self._add_cond(True, expr, lookups)
+
+    def _add_cond(
+        self, negated: bool, expr: Optional[str], lookups: Dict[str, Any]
+    ) -> "QuerySet[M]":
         qs = self._clone()
-        qs._filter = expr
+        if expr or lookups:
+            # Lookups are ANDed, so keyword order is irrelevant; sorting them
+            # gives every spelling of a filter the same shape and expression
+            items = sorted(lookups.items()) if len(lookups) > 1 else lookups.items()
+            qs._conds = self._conds + (
+                (
+                    negated,
+                    expr or None,
+                    tuple(key for key, _ in items),
+                    tuple(value for _, value in items),
+                ),
+            )
+            qs._compiled = None
         return qs
 
+    def _compile_expr(self) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Build the Milvus filter expression from the filter nodes.
+
+        Lookup values are returned separately as filter template parameters,
+        so queries of the same shape send the same expression string. The
+        result is kept until the filter nodes change; callers must not
+        mutate the returned parameters.
+        """
+        if self._compiled is not None:
+            return self._compiled
+
+        conds = self._conds
+        if len(conds) > 1 or (conds and len(conds[0][2]) > 1):
+            # Nodes are ANDed too; a canonical order makes chained filters
+            # send the same expression whatever order they were applied in
+            conds = sorted(_normalize(conds), key=_cond_sort_key)
+        template, renderers = _compile_shape(
+            tuple((negated, expr, keys) for negated, expr, keys, _ in conds)
+        )
+        params: Dict[str, Any] = {}
+        if template is not None:
+            literals = []
+            render_iter = iter(renderers)
+            for _, _, _, values in conds:
+                for value in values:
+                    render = next(render_iter)
+                    if render is None:
+                        params[f"_v{len(params)}"] = _bind_value(value)
+                    else:
+                        literals.append(render(value))
+            template = template.format(*literals)
+        self._compiled = (template, params)
+        return self._compiled
+
     def limit(self, limit: int) -> "QuerySet[M]":
         """Set maximum number of results to return."""
+        if limit == self._limit and self._limited:
+            # Builders never mutate self, so an unchanged limit can share it
+            return self
         qs = self._clone()
         qs._limit = limit
+        qs._limited = True
         return qs
 
     def offset(self, offset: int) -> "QuerySet[M]":
@@ -75,6 +478,43 @@ class QuerySet(Generic[M]):
         qs._offset = offset
         return qs
 
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Slice the query set lazily, e.g. qs[10:20].
+
+        Slices return a new QuerySet with the offset and limit narrowed, so
+        further builders can be chained before it is evaluated. An integer
+        index returns an awaitable for that single instance.
+        """
+        if isinstance(key, slice):
+            if key.step is not None:
+                raise ValueError("QuerySet slicing does not support steps")
+            start = key.start or 0
+            if start < 0 or (key.stop is not None and key.stop < 0):
+                raise ValueError("Negative indexing is not supported")
+            qs = self._clone()
+            qs._offset = self._offset + start
+            if key.stop is not None:
+                stop = min(key.stop, self._limit) if self._limited else key.stop
+                qs._limit = max(stop - start, 0)
+                qs._limited = True
+            elif self._limited:
+                qs._limit = max(self._limit - start, 0)
+            return qs
+        if isinstance(key, int):
+            if key < 0:
+                raise ValueError("Negative indexing is not supported")
+            return self._get_index(key)
+        raise TypeError(
+            f"QuerySet indices must be integers or slices, not {type(key).__name__}"
+        )
+
+    async def _get_index(self, index: int) -> M:
+        results = await self[index : index + 1].all()
+        if not results:
+            raise IndexError("QuerySet index out of range")
+        return results[0]
+
     def only(self, *fields: str) -> "QuerySet[M]":
         """Specify fields to return."""
         qs = self._clone()
@@ -84,7 +524,8 @@ class QuerySet(Generic[M]):
     def defer(self, *fields: str) -> "QuerySet[M]":
         """Specify fields to defer loading."""
         qs = self._clone()
-        qs._defer_fields = list(fields)
+        qs._defer_fields = frozenset(fields)
+        qs._model_fields = None
         return qs
 
     def search(
@@ -92,63 +533,91 @@ class QuerySet(Generic[M]):
         field_name: str,
         vector: Optional[List[float]] = None,
         data: Optional[List[str]] = None,
+        text: Optional[str] = None,
+        embedder: Optional[Callable[[str], Any]] = None,
+        cache: Optional[QueryEmbeddingCache] = None,
         **kwargs,
     ) -> "QuerySet[M]":
-        """Configure vector search parameters."""
-        if not vector and not data:
-            raise Exception("Should provide vector or data")
+        """Configure vector search parameters.
+
+        Pass text together with an embedder (sync or async callable) to embed
+        the query when the search runs; pass a QueryEmbeddingCache as cache
+        to reuse embeddings across searches.
+        """
+        if vector is None and not data and text is None:
+            raise Exception("Should provide vector, data or text")
+        if text is not None and embedder is None:
+            raise Exception("Should provide embedder to search by text")
 
         qs = self._clone()
         qs._vector_field = field_name
         qs._search_params = {
             "vector": vector,
             "data": data,
+            "text": text,
+            "embedder": embedder,
+            "cache": cache,
             "field_name": field_name,
-            "filter": qs._filter,
             **kwargs,
         }
         return qs
 
+    async def _embed_text(self) -> Any:
+        """Embed the search text, going through the embedding cache."""
+        text = self._search_params["text"]
+        cache = self._search_params["cache"]
+        embedder = self._search_params["embedder"]
+
+        vector = cache.get(text, embedder) if cache is not None else None
+        if vector is None:
+            vector = embedder(text)
+            if inspect.isawaitable(vector):
+                vector = await vector
+            if cache is not None:
+                vector = cache.put(text, vector, embedder)
+        return vector
+
     def _clone(self) -> "QuerySet[M]":
         """Clone the query set."""
-        qs = QuerySet(self.model_class)
-        qs._filter = self._filter
+        # Every slot is assigned below, so __init__ defaults are skipped
+        qs = object.__new__(type(self))
+        qs.model_class = self.model_class
+        # Derived values stay valid until a builder changes their inputs
+        qs._model_fields = self._model_fields
+        qs._conds = self._conds
+        qs._compiled = self._compiled
         qs._limit = self._limit
+        qs._limited = self._limited
         qs._offset = self._offset
         qs._output_fields = self._output_fields
         qs._defer_fields = self._defer_fields
-        qs._search_params = self._search_params.copy() if self._search_params else None
+        # Builders replace these values instead of mutating them, so clones
+        # share them rather than copying on every chained call
+        qs._search_params = self._search_params
         qs._vector_field = self._vector_field
         qs._consistency_level = self._consistency_level
         qs._collection_name = self._collection_name
+        qs._default_collection_name = self._default_collection_name
+        qs._alias = self._alias
         return qs
 
     def _get_model_fields(self):
-        if self._model_fields:
-            return self._model_fields
-        self._model_fields = [
-            k
-            for k, v in self.model_class._fields.items()
-            if not isinstance(v, SparseFloatVectorField)
-            and k not in set(self._defer_fields)
-        ]
+        if self._model_fields is None:
+            fields = self.model_class._non_sparse_fields
+            if self._defer_fields:
+                deferred = self._defer_fields
+                fields = [k for k in fields if k not in deferred]
+            # pymilvus requires output_fields to be a list
+            self._model_fields = list(fields)
         return self._model_fields
 
     async def get(self, **kwargs) -> M:
-        """Get a single instance matching the filter."""
-        # Build filter expression from kwargs
-        if kwargs:
-            expr_parts = []
-            for key, value in kwargs.items():
-                if isinstance(value, str):
-                    expr_parts.append(f"{key} == '{value}'")
-                else:
-                    expr_parts.append(f"{key} == {value}")
-            expr = " && ".join(expr_parts)
+        """Get a single instance matching the filter.
 
-            qs = self.filter(expr).limit(2)
-        else:
-            qs = self.limit(2)
+        Keyword arguments accept the same lookups as filter(), compiled once
+        per set of keys.
+        """
+        qs = (self.filter(**kwargs) if kwargs else self).limit(2)
 
         results = await qs.all()
 
@@ -163,111 +632,486 @@ class QuerySet(Generic[M]):
 
         return results[0]
 
-    async def all(self) -> List[M]:
-        """Return all instances matching the query."""
-        client = await ensure_connection()
+    async def bulk_get(self, ids: List[Any], chunk: int = 1024) -> List[M]:
+        """
+        Fetch the instances with the given primary keys.
 
-        # Check if collection exists
-        if not await client.has_collection(collection_name=self.get_collection_name()):
+        Keys are looked up with one "pk in [...]" query per chunk of ids, the
+        chunks running concurrently, instead of one get() per key.
+
+        Args:
+            ids: Primary key values to fetch
+            chunk: Maximum number of keys per query
+
+        Returns:
+            Instances found, in the order of ids; missing keys are skipped
+        """
+        if not ids:
             return []
+        primary_key = self.model_class._primary_key_field
+        lookup = f"{primary_key}__in"
+        chunks = [ids[i : i + chunk] for i in range(0, len(ids), chunk)]
+        results = await asyncio.gather(
+            *(self.filter(**{lookup: keys}).limit(len(keys)).all() for keys in chunks)
+        )
+
+        by_pk = {
+            getattr(instance, primary_key): instance
+            for instances in results
+            for instance in instances
+        }
+        return [by_pk[pk] for pk in ids if pk in by_pk]
+
+    async def get_by_pk(self, pk: Any, coalesce: float = 0.0) -> M:
+        """
+        Get the instance with the given primary key.
+
+        With coalesce > 0, lookups issued concurrently on unfiltered query
+        sets of the same collection are held for up to coalesce seconds and
+        sent as a single bulk_get(); each caller still gets its own result.
+        Query sets with an offset or limit are never coalesced.
 
-        # Load collection if not loaded
-        if not await client.has_collection(
-            collection_name=self.get_collection_name(), check_loaded=True
+        Args:
+            pk: Primary key value
+            coalesce: Seconds to wait for other lookups to batch with
+
+        Returns:
+            The matching instance
+
+        Raises:
+            DoesNotExist: If no instance has the primary key
+        """
+        if (
+            coalesce <= 0
+            or self._conds
+            or self._search_params
+            or self._offset
+            or self._limited
         ):
-            await client.load_collection(collection_name=self.get_collection_name())
+            return await self.get(**{self.model_class._primary_key_field: pk})
 
-        # Determine which method to use: search or query
+        key = (
+            self.model_class,
+            self._alias,
+            self.get_collection_name(),
+            tuple(self._output_fields or self._get_model_fields()),
+        )
+        loop = asyncio.get_running_loop()
+        batcher = _pk_batchers.get(key)
+        # A batcher left behind by a closed event loop never flushes
+        if batcher is None or batcher.loop is not loop:
+            batcher = _pk_batchers[key] = _PkBatcher(key, loop)
+        return await batcher.get(pk, coalesce)
+
+    async def _with_reload(
+        self, client: "AsyncMilvusClient", request: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Send a request, retrying once if the collection state was stale.
+
+        The loaded state is cached, so a collection released or dropped
+        outside the ORM fails the request; the cache entry is then dropped,
+        the collection checked and loaded again, and the request resent.
+        """
+        try:
+            return await request()
+        except MilvusException as exc:
+            if exc.code not in _STALE_STATE_CODES:
+                raise
+            _forget_loaded(self._alias, self.get_collection_name())
+            if not await self._ensure_loaded(client):
+                raise
+        return await request()
+
+    async def _ensure_loaded(self, client: "AsyncMilvusClient") -> bool:
+        """Load the collection if needed; return False if it does not exist.
+
+        A positive result is cached for LOADED_STATE_TTL seconds, so queries
+        in between skip the existence and load state round-trips.
+        """
+        collection_name = self.get_collection_name()
+        key = (self._alias, collection_name)
+        if _loaded_until.get(key, 0.0) > time.monotonic():
+            return True
+
+        async with loop_lock(_load_locks, key):
+            # Another coroutine may have loaded it while we waited
+            if _loaded_until.get(key, 0.0) > time.monotonic():
+                return True
+
+            # Check if collection exists
+            if not await client.has_collection(collection_name=collection_name):
+                return False
+
+            # Load collection if not loaded
+            if not await client.has_collection(
+                collection_name=collection_name, check_loaded=True
+            ):
+                await client.load_collection(collection_name=collection_name)
+            _loaded_until[key] = time.monotonic() + LOADED_STATE_TTL
+        return True
+
+    def __aiter__(self) -> AsyncIterator[M]:
+        return self.iterator()
+
+    async def iterator(self, batch_size: int = 1000) -> AsyncIterator[M]:
+        """
+        Iterate over instances matching the query, one page at a time.
+
+        Scalar queries page through the collection with a primary key cursor,
+        so only batch_size rows are held in memory at once. Unlike all(), the
+        iteration is only capped when limit() or a slice set a limit. Vector
+        searches are bounded by their limit and are fetched in one request.
+
+        AsyncMilvusClient has no query_iterator, so the pages are requested
+        with the same "iterator"/"reduce_stop_for_best" query options that
+        pymilvus's own QueryIterator sends to get rows in primary key order.
+        Their names are private to pymilvus; if they move, the keys the server
+        reads are used directly. An offset is skipped by
+        paging through primary keys first rather than being combined with
+        those options.
+        """
         if self._search_params and self._vector_field:
-            # Use vector search
-            results = await client.search(
+            for instance in await self.all():
+                yield instance
+            return
+
+        alias = self._alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        if not await self._ensure_loaded(client):
+            return
+
+        primary_key = self.model_class._primary_key_field
+        output_fields = self._output_fields or self._get_model_fields()
+        if primary_key not in output_fields:
+            output_fields = [*output_fields, primary_key]
+
+        collection_name = self.get_collection_name()
+        base_expr, params = self._compile_expr()
+        # The cursor parameter is added below; keep the compiled one intact
+        params = dict(params)
+        last_pk = None
+
+        async def next_page(size: int, fields: List[str]) -> List[dict]:
+            cursor = None
+            if last_pk is not None:
+                cursor = f"{primary_key} > {{_cursor}}"
+                params["_cursor"] = last_pk
+            if base_expr and cursor:
+                expr = f"({base_expr}) && {cursor}"
+            else:
+                expr = base_expr or cursor or ""
+            return await self._with_reload(
+                client,
+                lambda: client.query(
+                    collection_name=collection_name,
+                    filter=expr,
+                    filter_params=params,
+                    limit=size,
+                    output_fields=fields,
+                    consistency_level=self._consistency_level,
+                    **_ITERATOR_OPTIONS,
+                ),
+            )
+
+        # Skip the offset by moving the cursor over primary keys only
+        skip = self._offset
+        while skip > 0:
+            size = min(batch_size, skip)
+            rows = await next_page(size, [primary_key])
+            if len(rows) < size:
+                return
+            skip -= size
+            last_pk = rows[-1][primary_key]
+
+        from_row = self.model_class._from_result_fast
+        remaining = self._limit if self._limited else float("inf")
+        while remaining > 0:
+            size = int(min(batch_size, remaining))
+            rows = await next_page(size, output_fields)
+
+            for row in rows:
+                yield from_row(row)
+
+            if len(rows) < size:
+                return
+            remaining -= len(rows)
+            last_pk = rows[-1][primary_key]
+
+    async def _search(self, client: "AsyncMilvusClient", data: Any) -> Any:
+        """Run the configured vector search for the given query data."""
+        field = self.model_class._fields.get(self._search_params["field_name"])
+        if isinstance(field, DenseVectorField):
+            data = field.to_query_data(data)
+
+        extra = {
+            k: v
+            for k, v in self._search_params.items()
+            if k not in _RESERVED_SEARCH_PARAMS
+        }
+        if self._offset:
+            # Skipped hits are dropped by Milvus instead of being sent;
+            # only passed when set, pymilvus rejects it next to
+            # search_params["offset"]
+            extra["offset"] = self._offset
+
+        expr, params = self._compile_expr()
+        return await self._with_reload(
+            client,
+            lambda: client.search(
                 collection_name=self.get_collection_name(),
-                data=[v]
-                if (v := self._search_params["vector"])
-                else self._search_params["data"],
-                filter=self._filter,
+                data=data,
+                filter=expr,
+                filter_params=params,
                 anns_field=self._search_params["field_name"],
                 limit=self._limit,
                 output_fields=self._output_fields or self._get_model_fields(),
-                consistency_level=self._consistency_level
-                or self.model_class.Meta.consistency_level,
-                **{
-                    k: v
-                    for k, v in self._search_params.items()
-                    if k
-                    not in ["vector", "data", "field_name", "limit", "offset", "filter"]
-                },
-            )
+                consistency_level=self._consistency_level,
+                **extra,
+            ),
+        )
 
-            # Convert search results to model instances
-            instances = []
-            for result in results[0]:  # results is a list of result lists
-                entity = result.entity
-                data = entity.to_dict()
-                instances.append(
-                    self.model_class(
-                        _from_result=True, _distance=result.distance, **data["entity"]
+    async def batch_search(
+        self, field_name: str, vectors: Any, **kwargs
+    ) -> List[List[M]]:
+        """
+        Search several query vectors with a single search request.
+
+        The filter, limit, offset and output fields of this query set apply
+        to every query vector.
+
+        Pass SearchQuery items instead of plain vectors to give queries their
+        own limit, filter or search parameters; plain vectors may be mixed in
+        and use the query set's settings. Queries sharing the same settings
+        are still sent together, one request per distinct group, and the
+        groups run concurrently.
+
+        Args:
+            field_name: Vector field to search
+            vectors: Query vectors, a sequence of vectors or a 2D array, or
+                a sequence of SearchQuery
+            **kwargs: Extra search arguments, as for search(); limit, offset
+                and filter are applied as by limit(), offset() and filter()
+
+        Returns:
+            One list of instances per query vector, in the same order
+
+        Raises:
+            TypeError: If kwargs holds another name batch_search sets itself
+        """
+        if kwargs.keys() & _RESERVED_SEARCH_PARAMS:
+            qs = self
+            for name in sorted(kwargs.keys() & _RESERVED_SEARCH_PARAMS):
+                value = kwargs.pop(name)
+                if name == "limit":
+                    qs = qs.limit(value)
+                elif name == "offset":
+                    qs = qs.offset(value)
+                elif name == "filter":
+                    qs = qs.filter(value)
+                else:
+                    raise TypeError(
+                        f"batch_search() got an unexpected keyword argument {name!r}"
                     )
+            return await qs.batch_search(field_name, vectors, **kwargs)
+        if len(vectors) == 0:
+            return []
+        if any(isinstance(v, SearchQuery) for v in vectors):
+            # Bare vectors in a mixed list use the query set's settings
+            queries = [
+                v if isinstance(v, SearchQuery) else SearchQuery(v) for v in vectors
+            ]
+            return await self._batch_search_queries(field_name, queries, kwargs)
+        if self._limit <= 0:
+            return [[] for _ in range(len(vectors))]
+
+        alias = self._alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        if not await self._ensure_loaded(client):
+            return [[] for _ in range(len(vectors))]
+
+        qs = self._clone()
+        qs._vector_field = field_name
+        qs._search_params = {"field_name": field_name, **kwargs}
+        results = await qs._search(client, vectors)
+
+        from_hit = self.model_class._from_hit
+        return [[from_hit(hit) for hit in hits] for hits in results]
+
+    async def _batch_search_queries(
+        self, field_name: str, queries: List[SearchQuery], kwargs: Dict[str, Any]
+    ) -> List[List[M]]:
+        # Group query positions by their settings; search_params may hold
+        # nested dicts, so its canonical JSON form is used as the key
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for i, query in enumerate(queries):
+            key = (
+                query.limit,
+                query.filter,
+                json.dumps(query.search_params, sort_keys=True, default=repr),
+            )
+            groups.setdefault(key, []).append(i)
+
+        searches = []
+        for positions in groups.values():
+            query = queries[positions[0]]
+            qs = self.filter(query.filter) if query.filter else self
+            if query.limit is not None:
+                qs = qs.limit(query.limit)
+            search_kwargs = kwargs
+            if query.search_params is not None:
+                search_kwargs = {**kwargs, "search_params": query.search_params}
+            searches.append(
+                qs.batch_search(
+                    field_name,
+                    [queries[i].vector for i in positions],
+                    **search_kwargs,
                 )
+            )
+
+        results: List[List[M]] = [[] for _ in range(len(queries))]
+        for positions, group_results in zip(
+            groups.values(), await asyncio.gather(*searches), strict=True
+        ):
+            for i, instances in zip(positions, group_results, strict=True):
+                results[i] = instances
+        return results
 
-            # Apply offset
-            if self._offset > 0:
-                instances = instances[self._offset :]
+    async def all(self) -> List[M]:
+        """Return all instances matching the query."""
+        if self._limit <= 0:
+            # An empty slice; Milvus would treat a zero limit as unset
+            return []
+
+        alias = self._alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        # Check if collection exists and load it if needed
+        if not await self._ensure_loaded(client):
+            return []
+
+        # Determine which method to use: search or query
+        if self._search_params and self._vector_field:
+            vector = self._search_params["vector"]
+            if vector is None and self._search_params["text"] is not None:
+                vector = await self._embed_text()
+
+            # Use vector search
+            results = await self._search(
+                client,
+                [vector] if vector is not None else self._search_params["data"],
+            )
 
-            return instances
+            # Convert search results to model instances
+            from_hit = self.model_class._from_hit
+            return [from_hit(hit) for hit in results[0]]
         else:
+            expr, params = self._compile_expr()
+
             # Use scalar query
-            results = await client.query(
-                collection_name=self.get_collection_name(),
-                filter=self._filter or "",
-                limit=self._limit,
-                offset=self._offset,
-                output_fields=self._output_fields or self._get_model_fields(),
-                consistency_level=self._consistency_level
-                or self.model_class.Meta.consistency_level,
+            results = await self._with_reload(
+                client,
+                lambda: client.query(
+                    collection_name=self.get_collection_name(),
+                    filter=expr or "",
+                    filter_params=params,
+                    limit=self._limit,
+                    offset=self._offset,
+                    output_fields=self._output_fields or self._get_model_fields(),
+                    consistency_level=self._consistency_level,
+                ),
             )
 
             # Convert query results to model instances
-            return [self.model_class(_from_result=True, **item) for item in results]
+            from_row = self.model_class._from_result_fast
+            return [from_row(item) for item in results]
 
-    async def count(self) -> int:
-        """Count instances matching the query."""
-        client = await ensure_connection()
+    async def count(self, exact: bool = True) -> int:
+        """Count instances matching the query.
 
-        # Check if collection exists
-        if not await client.has_collection(collection_name=self.get_collection_name()):
+        With exact=False an unfiltered count is read from the collection
+        statistics instead of running a count(*) query. That is a metadata
+        read, but the row count may still include deleted entities that
+        have not been compacted yet.
+        """
+        alias = self._alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        # Check if collection exists and load it if needed
+        if not await self._ensure_loaded(client):
             return 0
 
-        # Load collection if not loaded
-        if not await client.has_collection(
-            collection_name=self.get_collection_name(), check_loaded=True
-        ):
-            await client.load_collection(collection_name=self.get_collection_name())
+        if not exact and not self._conds:
+            stats = await client.get_collection_stats(
+                collection_name=self.get_collection_name()
+            )
+            return int(stats["row_count"])
+
+        expr, params = self._compile_expr()
 
         # Use query with limit=0 to get count
-        results = await client.query(
-            collection_name=self.get_collection_name(),
-            filter=self._filter or "",
-            consistency_level=self._consistency_level
-            or self.model_class.Meta.consistency_level,
-            # limit=0,
-            output_fields=["count(*)"],
+        results = await self._with_reload(
+            client,
+            lambda: client.query(
+                collection_name=self.get_collection_name(),
+                filter=expr or "",
+                filter_params=params,
+                consistency_level=self._consistency_level,
+                # limit=0,
+                output_fields=["count(*)"],
+            ),
         )
 
         return results[0]["count(*)"]
 
+    async def exists(self) -> bool:
+        """Return True if the query matches at least one instance.
+
+        Fetches at most one primary key instead of counting every match.
+        """
+        if self._search_params and self._vector_field:
+            return bool(await self.limit(1).all())
+
+        alias = self._alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
+
+        # Check if collection exists and load it if needed
+        if not await self._ensure_loaded(client):
+            return False
+
+        expr, params = self._compile_expr()
+        results = await self._with_reload(
+            client,
+            lambda: client.query(
+                collection_name=self.get_collection_name(),
+                filter=expr or "",
+                filter_params=params,
+                limit=1,
+                offset=self._offset,
+                output_fields=[self.model_class._primary_key_field],
+                consistency_level=self._consistency_level,
+            ),
+        )
+        return len(results) > 0
+
     async def delete(self) -> int:
         """Delete all instances matching the query."""
-        client = await ensure_connection()
+        alias = self._alias
+        client = get_client_sync(alias) or await ensure_connection(alias)
 
         # Check if collection exists
         if not await client.has_collection(collection_name=self.get_collection_name()):
             return 0
 
+        expr, params = self._compile_expr()
+
         # Delete using filter
         result = await client.delete(
             collection_name=self.get_collection_name(),
-            filter=self._filter or "",
+            filter=expr or "",
+            filter_params=params,
         )
 
         return result.get("delete_count", 0)
@@ -279,6 +1123,143 @@ class QuerySet(Generic[M]):
 
     async def last(self) -> Optional[M]:
         """Return the last instance matching the query."""
-        # Milvus doesn't support ordering directly, so we get all and take last
-        results = await self.all()
-        return results[-1] if results else None
+        if self._search_params and self._vector_field:
+            # Search hits are ranked, so the last one is only known after all
+            results = await self.all()
+            return results[-1] if results else None
+
+        # Milvus doesn't support ordering directly; count the matches and
+        # fetch only the final row of the offset/limit window
+        end = min(await self.count(), self._offset + self._limit)
+        if end <= self._offset:
+            return None
+        results = await self.offset(end - 1).limit(1).all()
+        return results[0] if results else None
+
+
+class _PkBatcher:
+    """Collects concurrent primary key lookups into one bulk_get() call."""
+
+    __slots__ = ("queryset", "key", "loop", "pending", "handle")
+
+    # Pending lookups are flushed early once this many keys are waiting
+    MAX_BATCH = 1024
+
+    # The event loop only keeps weak references to tasks, and a batcher is
+    # dropped once it is flushed, so running flushes are held here
+    _tasks: Set["asyncio.Task[None]"] = set()
+
+    def __init__(self, key: Tuple[Any, ...], loop: asyncio.AbstractEventLoop):
+        model_class, _, collection_name, output_fields = key
+        # Built from the unfiltered query set, so no caller's options leak
+        # into the lookups of the others
+        self.queryset: QuerySet = model_class.objects.on(collection_name).only(
+            *output_fields
+        )
+        self.key = key
+        self.loop = loop
+        self.pending: Dict[Any, List[asyncio.Future]] = {}
+        self.handle: Optional[asyncio.TimerHandle] = None
+
+    def get(self, pk: Any, delay: float) -> "asyncio.Future":
+        future = self.loop.create_future()
+        self.pending.setdefault(pk, []).append(future)
+        if len(self.pending) >= self.MAX_BATCH:
+            self._schedule_flush()
+        elif self.handle is None:
+            self.handle = self.loop.call_later(delay, self._schedule_flush)
+        return future
+
+    def _schedule_flush(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        pending, self.pending = self.pending, {}
+        # Nothing is waiting any more; the next lookup starts a new batcher,
+        # so the registry never keeps idle batchers and their query sets
+        if _pk_batchers.get(self.key) is self:
+            del _pk_batchers[self.key]
+        if pending:
+            task = asyncio.ensure_future(self._flush(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, pending: Dict[Any, List[asyncio.Future]]) -> None:
+        try:
+            instances = await self.queryset.bulk_get(list(pending))
+        except Exception as exc:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        primary_key = self.queryset.model_class._primary_key_field
+        found = {getattr(instance, primary_key): instance for instance in instances}
+        name = self.queryset.model_class.__name__
+        for pk, futures in pending.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if pk in found:
+                    future.set_result(found[pk])
+                else:
+                    future.set_exception(
+                        DoesNotExist(f"{name} matching query does not exist.")
+                    )
+
+
+# (model, connection alias, collection name, output fields) -> batcher with
+# pending lookups
+_pk_batchers: Dict[Tuple[Any, ...], _PkBatcher] = {}
+
+
+def _request_key(qs: QuerySet) -> Optional[Tuple[Any, ...]]:
+    """Key identifying the scalar query a query set sends, None for searches."""
+    if qs._search_params and qs._vector_field:
+        return None
+    expr, params = qs._compile_expr()
+    return (
+        qs.model_class,
+        qs._alias,
+        qs.get_collection_name(),
+        expr,
+        json.dumps(params, sort_keys=True, default=repr),
+        qs._limit,
+        qs._offset,
+        tuple(qs._output_fields or qs._get_model_fields()),
+        qs._consistency_level,
+    )
+
+
+async def gather_all(*querysets: QuerySet) -> List[List[Any]]:
+    """
+    Run several query sets concurrently.
+
+    Collection checks are shared: query sets on the same collection wait on
+    one existence/load check, whose result is cached for the others. Scalar
+    query sets that would send the same request, e.g. identical filters
+    built separately, are only run once; each gets its own result list
+    holding the same instances.
+
+    Args:
+        *querysets: Query sets to evaluate
+
+    Returns:
+        One result list per query set, as returned by QuerySet.all
+    """
+    tasks: Dict[Tuple[Any, ...], int] = {}
+    coros = []
+    positions = []
+    for qs in querysets:
+        key = _request_key(qs)
+        if key is None or key not in tasks:
+            if key is not None:
+                tasks[key] = len(coros)
+            positions.append(len(coros))
+            coros.append(qs.all())
+        else:
+            positions.append(tasks[key])
+
+    results = await asyncio.gather(*coros)
+    return [list(results[i]) for i in positions]
@@ -1,5 +1,45 @@
+import asyncio
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Mapping, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
 class classproperty:
     def __init__(self, func):
         self.fget = func
+
     def __get__(self, instance, owner):
-        return self.fget(owner)
\ No newline at end of file
+        return self.fget(owner)
+
+
+def freeze(mapping: Mapping) -> MappingProxyType:
+    """Return a read-only view of a mapping, freezing nested dicts too."""
+    return MappingProxyType(
+        {k: freeze(v) if isinstance(v, Mapping) else v for k, v in mapping.items()}
+    )
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain, mutable dict copy of a (possibly frozen) mapping."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    return value
+
+
+def loop_lock(
+    locks: Dict[K, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]],
+    key: K,
+) -> asyncio.Lock:
+    """
+    Return the lock for key in a registry of asyncio locks.
+
+    An asyncio.Lock is bound to the event loop that first waits on it, so
+    each lock is stored with its loop and replaced when used from another
+    one, e.g. by a later asyncio.run() call.
+    """
+    loop = asyncio.get_running_loop()
+    entry = locks.get(key)
+    if entry is None or entry[0] is not loop:
+        entry = locks[key] = (loop, asyncio.Lock())
+    return entry[1]
@@ -21,8 +21,9 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.7',
+    python_requires='>=3.10',
     install_requires=[
-        "pymilvus>=2.3.0",
+        "pymilvus>=2.6.0",
+        "numpy",
     ],
 )
\ No newline at end of file